@@ -10,6 +10,7 @@ Created for: Roche DART Program Interview
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -17,8 +18,14 @@ from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy path below is used instead
+    njit = None
+
 # Import data loader for automatic data download
 from data_loader import download_and_extract_faers_data
+from faers_io import CATEGORY, read_faers_table
 
 # Page configuration
 st.set_page_config(
@@ -79,50 +86,83 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data
-def load_data(sample_size=50000):
-    """Load FAERS data with caching"""
+# Columns the dashboard uses from each table; the rest are skipped at parse time.
+# DEMO is read whole because the missing-data profile covers every field.
+REAC_COLS = ['primaryid', 'caseid', 'pt']
+DRUG_COLS = ['primaryid', 'caseid', 'drugname', 'role_cod']
+OUTC_COLS = ['primaryid', 'caseid', 'outc_cod']
+
+# Any remaining string columns stay Arrow-backed in pandas instead of being
+# converted to one Python object per cell
+ARROW_STRING_TYPES = {
+    pa.string(): pd.ArrowDtype(pa.string()),
+    pa.large_string(): pd.ArrowDtype(pa.large_string())
+}
+
+
+def load_faers_table(filename, nrows=None, column_types=None, columns=None):
+    """Load one FAERS table indexed on primaryid, downloading the data if needed"""
     data_path = Path(__file__).parent / 'data'
     
     # Auto-download data if not present
     download_and_extract_faers_data()
     
-    try:
-        demo_df = pd.read_csv(
-            data_path / 'ASCII/DEMO25Q3.txt',
-            sep='$',
-            encoding='latin1',
-            nrows=sample_size,
-            low_memory=False
-        )
-        
-        reac_df = pd.read_csv(
-            data_path / 'ASCII/REAC25Q3.txt',
-            sep='$',
-            encoding='latin1',
-            low_memory=False
-        )
-        
-        drug_df = pd.read_csv(
-            data_path / 'ASCII/DRUG25Q3.txt',
-            sep='$',
-            encoding='latin1',
-            low_memory=False
-        )
-        
-        outc_df = pd.read_csv(
-            data_path / 'ASCII/OUTC25Q3.txt',
-            sep='$',
-            encoding='latin1',
-            low_memory=False
-        )
-        
-        return demo_df, reac_df, drug_df, outc_df
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        return None, None, None, None
+    path = data_path / 'ASCII' / filename
+    suffix = f'.{nrows}' if nrows is not None else ''
+    table = read_faers_table(
+        path,
+        data_path / 'cache' / f'{path.stem}{suffix}.parquet',
+        nrows=nrows,
+        column_types=column_types,
+        columns=columns
+    )
+    df = table.to_pandas(types_mapper=ARROW_STRING_TYPES.get)
+    
+    # Index on primaryid (the report key, which already encodes caseid + version)
+    # and sort it so joins take the monotonic-index path
+    return df.set_index('primaryid', drop=False).sort_index(kind='stable')
+
+
+@st.cache_data
+def load_demo(sample_size=50000):
+    """Load the FAERS demographics sample with caching"""
+    # Pin the fractional columns, which the first block could type as integers
+    return load_faers_table(
+        'DEMO25Q3.txt',
+        nrows=sample_size,
+        column_types={
+            'age': pa.float32(),
+            'wt': pa.float64(),
+            'sex': CATEGORY,
+            'reporter_country': CATEGORY,
+            'occp_cod': CATEGORY
+        }
+    )
+
+
+@st.cache_data
+def load_reac():
+    """Load FAERS adverse reactions with caching"""
+    return load_faers_table('REAC25Q3.txt', column_types={'pt': CATEGORY}, columns=REAC_COLS)
 
 
+@st.cache_data
+def load_drug():
+    """Load FAERS drug records with caching"""
+    return load_faers_table(
+        'DRUG25Q3.txt',
+        column_types={'drugname': CATEGORY, 'role_cod': CATEGORY},
+        columns=DRUG_COLS
+    )
+
+
+@st.cache_data
+def load_outc():
+    """Load FAERS patient outcomes with caching"""
+    return load_faers_table('OUTC25Q3.txt', column_types={'outc_cod': CATEGORY}, columns=OUTC_COLS)
+
+
+@st.cache_data(show_spinner=False)
 def calculate_completeness(demo_df):
     """Calculate field completeness scores"""
     critical_fields = {
@@ -135,96 +175,139 @@ def calculate_completeness(demo_df):
         'Report Code': 'rept_cod'
     }
     
-    completeness = {}
-    for name, col in critical_fields.items():
-        if col in demo_df.columns:
-            non_null = demo_df[col].notna().sum()
-            total = len(demo_df)
-            completeness[name] = (non_null / total) * 100
+    present = {col: name for name, col in critical_fields.items() if col in demo_df.columns}
+    completeness_pct = demo_df[list(present)].notna().mean() * 100
     
-    return completeness
+    return {present[col]: pct for col, pct in completeness_pct.items()}
 
 
+@st.cache_data(show_spinner=False)
 def detect_anomalies(demo_df):
     """Detect anomalies in reporting patterns"""
-    demo_df['fda_dt_parsed'] = pd.to_datetime(
+    # Keep dates as datetime64 (no per-row date objects) and leave demo_df untouched
+    fda_dates = pd.to_datetime(
         demo_df['fda_dt'],
         format='%Y%m%d',
-        errors='coerce'
+        errors='coerce',
+        cache=True
     )
     
-    daily_counts = demo_df.groupby(
-        demo_df['fda_dt_parsed'].dt.date
-    ).size().reset_index(name='count')
-    daily_counts.columns = ['date', 'count']
+    counts = fda_dates.value_counts().sort_index()
+    daily_counts = counts.rename_axis('date').reset_index(name='count')
     
-    mean_count = daily_counts['count'].mean()
-    std_count = daily_counts['count'].std()
-    daily_counts['z_score'] = (daily_counts['count'] - mean_count) / std_count
-    daily_counts['is_anomaly'] = abs(daily_counts['z_score']) > 3
+    count_values = counts.to_numpy(dtype=np.float64)
+    mean_count = count_values.mean()
+    std_count = count_values.std(ddof=1)
+    daily_counts['z_score'] = (count_values - mean_count) / std_count
+    daily_counts['is_anomaly'] = np.abs(daily_counts['z_score']) > 3
     
     return daily_counts
 
 
-def calculate_prr_signals(drug_df, reac_df, demo_df, min_cases=2):
-    """Calculate PRR-based safety signals (optimized for speed)"""
-    drug_reaction = drug_df.merge(reac_df, on=['primaryid', 'caseid'], how='inner')
-    drug_reaction = drug_reaction[drug_reaction['role_cod'] == 'PS']
-    
-    # Balanced scope: 20 drugs x 30 reactions = 600 combinations (fast)
-    top_drugs = drug_reaction['drugname'].value_counts().head(20).index
-    top_reactions = drug_reaction['pt'].value_counts().head(30).index
-    
-    # Pre-compute counts for speed (avoiding repeated filtering)
-    drug_reaction_counts = drug_reaction.groupby(['drugname', 'pt']).size().to_dict()
-    drug_totals = drug_reaction.groupby('drugname').size().to_dict()
-    reaction_totals = drug_reaction.groupby('pt').size().to_dict()
-    
-    signals = []
-    total_cases = len(demo_df)
-    total_drug_reactions = len(drug_reaction)
-    
-    for drug in top_drugs:
-        b_total = drug_totals.get(drug, 0)
-        if b_total == 0:
-            continue
-            
-        for reaction in top_reactions:
-            a = drug_reaction_counts.get((drug, reaction), 0)
-            
-            if a < min_cases:
-                continue
-            
-            b = b_total - a
-            c = reaction_totals.get(reaction, 0) - a
-            d = total_drug_reactions - a - b - c
-            
+@st.cache_data(show_spinner=False)
+def ps_drug_reaction(drug_df, reac_df):
+    """Join primary suspect drugs with their reported reactions"""
+    # Filter before joining so the hash join only sees PS drug records
+    ps_drugs = drug_df[drug_df['role_cod'] == 'PS']
+    return ps_drugs.join(reac_df[['pt']], how='inner')
+
+
+def _prr_chi2_numpy(a, drug_totals, reaction_totals, total_drug_reactions, total_cases):
+    """PRR and chi-square per drug-reaction pair (0 where the 2x2 table is degenerate)"""
+    b = drug_totals - a
+    c = reaction_totals - a
+    d = total_drug_reactions - a - b - c
+    
+    # Guard each division with the 2x2 validity predicate rather than dividing
+    # everywhere and masking inf/nan afterwards (b, c, d > 0 keeps every
+    # chi-square denominator factor positive too)
+    valid = (b > 0) & (c > 0) & (d > 0)
+    drug_ratio = np.divide(a, b, out=np.zeros_like(a), where=valid)
+    other_ratio = np.divide(c, d, out=np.ones_like(a), where=valid)
+    prr = np.divide(drug_ratio, other_ratio, out=np.zeros_like(a), where=valid)
+    chi2 = np.divide(
+        total_cases * (a*d - b*c)**2,
+        (a+b)*(c+d)*(a+c)*(b+d),
+        out=np.zeros_like(a),
+        where=valid
+    )
+    return prr, chi2
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _prr_chi2_numba(a, drug_totals, reaction_totals, total_drug_reactions, total_cases):
+        """Fused single-pass version of _prr_chi2_numpy"""
+        n = a.shape[0]
+        prr = np.zeros(n)
+        chi2 = np.zeros(n)
+        for i in prange(n):
+            b = drug_totals[i] - a[i]
+            c = reaction_totals[i] - a[i]
+            d = total_drug_reactions - a[i] - b - c
             if b > 0 and c > 0 and d > 0:
-                prr = (a / b) / (c / d) if (c * b) > 0 else 0
-                
-                try:
-                    chi2 = total_cases * (a*d - b*c)**2 / ((a+b)*(c+d)*(a+c)*(b+d))
-                except ZeroDivisionError:
-                    chi2 = 0
-                
-                # Relaxed criteria for demo: PRR >= 1.3, chi2 >= 1.5, cases >= 2
-                if prr >= 1.3 and chi2 >= 1.5:
-                    signals.append({
-                        'drug': drug,
-                        'reaction': reaction,
-                        'prr': prr,
-                        'chi2': chi2,
-                        'cases': a,
-                        'signal_strength': 'Strong' if prr >= 5 else 'Moderate'
-                    })
-    
-    return pd.DataFrame(signals).sort_values('prr', ascending=False) if signals else pd.DataFrame()
+                prr[i] = (a[i] / b) / (c / d)
+                chi2[i] = total_cases * (a[i]*d - b*c)**2 / ((a[i]+b)*(c+d)*(a[i]+c)*(b+d))
+        return prr, chi2
+
+
+# Below this many candidate pairs JIT start-up costs more than it saves
+NUMBA_MIN_PAIRS = 100_000
+
+
+@st.cache_data(show_spinner=False)
+def calculate_prr_signals(drug_reaction, demo_df, min_cases=2):
+    """Calculate PRR-based safety signals over the observed drug-reaction pairs"""
+    # Marginal totals over all drugs / reactions, not just the analysed scope
+    drug_totals = drug_reaction['drugname'].value_counts(sort=False)
+    reaction_totals = drug_reaction['pt'].value_counts(sort=False)
+    
+    # Balanced scope: 20 drugs x 30 reactions = 600 combinations (fast).
+    # nlargest partially selects the top-K instead of sorting every count
+    top_drugs = drug_totals.nlargest(20).index
+    top_reactions = reaction_totals.nlargest(30).index
+    
+    in_scope = drug_reaction['drugname'].isin(top_drugs) & drug_reaction['pt'].isin(top_reactions)
+    
+    # Sparse contingency: only pairs that co-occur at least min_cases times are
+    # evaluated, so the cost follows observed pairs rather than drugs x reactions.
+    # observed=True keeps unused categories out of the groupby result
+    pair_counts = drug_reaction[in_scope].groupby(['drugname', 'pt'], observed=True).size()
+    pair_counts = pair_counts[pair_counts >= min_cases]
+    drugs = pair_counts.index.get_level_values('drugname')
+    reactions = pair_counts.index.get_level_values('pt')
+    
+    # 2x2 contingency inputs per pair (float to avoid int overflow in chi2)
+    a = pair_counts.to_numpy(dtype=np.float64)
+    pair_drug_totals = drug_totals.reindex(drugs).to_numpy(dtype=np.float64)
+    pair_reaction_totals = reaction_totals.reindex(reactions).to_numpy(dtype=np.float64)
+    
+    if njit is not None and len(a) >= NUMBA_MIN_PAIRS:
+        prr_chi2 = _prr_chi2_numba
+    else:
+        prr_chi2 = _prr_chi2_numpy
+    prr, chi2 = prr_chi2(a, pair_drug_totals, pair_reaction_totals,
+                         float(len(drug_reaction)), float(len(demo_df)))
+    
+    # Relaxed criteria for demo: PRR >= 1.3, chi2 >= 1.5, cases >= 2
+    is_signal = (prr >= 1.3) & (chi2 >= 1.5)
+    if not is_signal.any():
+        return pd.DataFrame()
+    
+    signals = pd.DataFrame({
+        'drug': np.asarray(drugs)[is_signal],
+        'reaction': np.asarray(reactions)[is_signal],
+        'prr': prr[is_signal],
+        'chi2': chi2[is_signal],
+        'cases': a[is_signal].astype(np.int64),
+        'signal_strength': np.where(prr[is_signal] >= 5, 'Strong', 'Moderate')
+    })
+    return signals.sort_values('prr', ascending=False)
 
 
+@st.cache_data(show_spinner=False)
 def analyze_outcomes(demo_df, outc_df):
     """Analyze patient outcomes"""
-    cases_with_outcomes = demo_df.merge(outc_df, on=['primaryid', 'caseid'], how='left')
-    
     serious_codes = {
         'DE': 'Death',
         'LT': 'Life-Threatening',
@@ -234,12 +317,12 @@ def analyze_outcomes(demo_df, outc_df):
         'RI': 'Required Intervention'
     }
     
-    outcome_counts = {}
-    for code, description in serious_codes.items():
-        count = (cases_with_outcomes['outc_cod'] == code).sum()
-        outcome_counts[description] = count
+    # Only the per-code counts are needed, so count outcome rows of sampled
+    # reports directly instead of materializing the demo/outcome join
+    in_sample = outc_df['primaryid'].isin(demo_df['primaryid'].unique())
+    counts = outc_df.loc[in_sample, 'outc_cod'].value_counts()
     
-    return outcome_counts
+    return {description: int(counts.get(code, 0)) for code, description in serious_codes.items()}
 
 
 def main():
@@ -264,11 +347,20 @@ def main():
     **Data:** Real adverse event reports
     """)
     
-    # Load data
-    with st.spinner("Loading FAERS data..."):
-        demo_df, reac_df, drug_df, outc_df = load_data(50000)
+    if page == "About":
+        show_about()
+        return
     
-    if demo_df is None:
+    # Load only the tables the selected page needs
+    try:
+        with st.spinner("Loading FAERS data..."):
+            demo_df = load_demo(50000)
+            if page != "Data Quality Analysis":
+                reac_df = load_reac()
+                drug_df = load_drug()
+                outc_df = load_outc()
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
         st.error("Failed to load data. Please check data files.")
         return
     
@@ -276,11 +368,9 @@ def main():
     if page == "Overview":
         show_overview(demo_df, reac_df, drug_df, outc_df)
     elif page == "Data Quality Analysis":
-        show_data_quality(demo_df, reac_df, drug_df)
+        show_data_quality(demo_df)
     elif page == "Safety Signal Detection":
         show_signal_detection(demo_df, reac_df, drug_df, outc_df)
-    elif page == "About":
-        show_about()
 
 
 def show_overview(demo_df, reac_df, drug_df, outc_df):
@@ -342,7 +432,7 @@ def show_overview(demo_df, reac_df, drug_df, outc_df):
     
     with col2:
         st.subheader("🌍 Geographic Distribution")
-        country_counts = demo_df['reporter_country'].value_counts().head(10)
+        country_counts = demo_df['reporter_country'].value_counts(sort=False).nlargest(10)
         
         fig = px.bar(
             x=country_counts.values,
@@ -363,23 +453,30 @@ def show_overview(demo_df, reac_df, drug_df, outc_df):
         st.subheader("👥 Patient Demographics")
         
         # Age distribution - filter out invalid ages (0-120 years only)
-        age_data = demo_df['age'].dropna()
-        age_data = age_data[(age_data >= 0) & (age_data <= 120)]
+        age = demo_df['age'].to_numpy(dtype=np.float32)
+        has_age = ~np.isnan(age)
+        valid_age = age[has_age & (age >= 0) & (age <= 120)]
         
-        fig = px.histogram(
-            age_data,
-            nbins=50,
+        # Bin in NumPy and plot the counts directly
+        counts, edges = np.histogram(valid_age, bins=50)
+        fig = go.Figure(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            marker_color='#ff7f0e'
+        ))
+        fig.update_layout(
             title="Age Distribution (Valid Ages: 0-120 years)",
-            labels={'value': 'Age (years)', 'count': 'Number of Cases'}
+            xaxis_title="Age (years)",
+            yaxis_title="Number of Cases",
+            bargap=0,
+            height=350,
+            showlegend=False
         )
-        fig.update_traces(marker_color='#ff7f0e')
-        fig.update_layout(height=350, showlegend=False)
         st.plotly_chart(fig, use_container_width=True)
         
         # Show data quality note
-        total_with_age = demo_df['age'].notna().sum()
-        valid_ages = len(age_data)
-        invalid_ages = total_with_age - valid_ages
+        invalid_ages = has_age.sum() - len(valid_age)
         if invalid_ages > 0:
             st.caption(f"⚠️ Filtered out {invalid_ages:,} invalid age values (>120 or <0)")
     
@@ -399,7 +496,7 @@ def show_overview(demo_df, reac_df, drug_df, outc_df):
         st.plotly_chart(fig, use_container_width=True)
 
 
-def show_data_quality(demo_df, reac_df, drug_df):
+def show_data_quality(demo_df):
     """Data Quality Analysis Dashboard"""
     st.header("🔍 Data Quality Analysis")
     
@@ -436,7 +533,10 @@ def show_data_quality(demo_df, reac_df, drug_df):
     with col2:
         # Table
         st.dataframe(
-            completeness_df.style.format({'Completeness %': '{:.2f}%'}),
+            completeness_df,
+            column_config={
+                'Completeness %': st.column_config.NumberColumn(format='%.2f%%')
+            },
             use_container_width=True,
             height=400
         )
@@ -454,10 +554,11 @@ def show_data_quality(demo_df, reac_df, drug_df):
     **Method:** Statistical analysis of missing value distribution across all fields.
     """)
     
+    missing_counts = demo_df.isna().sum()
     missing_stats = pd.DataFrame({
-        'Field': demo_df.columns,
-        'Missing Count': [demo_df[col].isna().sum() for col in demo_df.columns],
-        'Missing %': [(demo_df[col].isna().sum() / len(demo_df) * 100) for col in demo_df.columns]
+        'Field': missing_counts.index,
+        'Missing Count': missing_counts.to_numpy(),
+        'Missing %': missing_counts.to_numpy() / len(demo_df) * 100
     })
     missing_stats = missing_stats[missing_stats['Missing %'] > 0].sort_values('Missing %', ascending=False)
     
@@ -535,7 +636,7 @@ def show_data_quality(demo_df, reac_df, drug_df):
         if len(anomaly_data) > 0:
             st.markdown("### 🔴 Anomalous Days")
             for idx, row in anomaly_data.nlargest(5, 'count').iterrows():
-                st.text(f"{row['date']}: {row['count']:,} reports")
+                st.text(f"{row['date']:%Y-%m-%d}: {row['count']:,} reports")
     
     st.markdown("---")
     
@@ -547,18 +648,19 @@ def show_data_quality(demo_df, reac_df, drug_df):
     """)
     
     # Calculate quality scores
-    scores = pd.DataFrame(index=demo_df.index)
     critical_fields = ['caseid', 'fda_dt', 'age', 'sex', 'reporter_country']
-    scores['completeness'] = demo_df[critical_fields].notna().sum(axis=1) / len(critical_fields) * 40
-    scores['age_valid'] = 20
-    scores.loc[demo_df['age'].isna(), 'age_valid'] = 0
-    scores.loc[demo_df['age'] > 120, 'age_valid'] = 0
-    scores['date_valid'] = 20
-    scores['reporter_info'] = (
-        demo_df['reporter_country'].notna().astype(int) * 10 +
-        demo_df['occp_cod'].notna().astype(int) * 10
+    completeness_pts = demo_df[critical_fields].notna().to_numpy().sum(axis=1) / len(critical_fields) * 40
+    age = demo_df['age'].to_numpy()
+    age_valid_pts = np.where(np.isnan(age) | (age > 120), 0, 20)
+    date_valid_pts = 20
+    reporter_info_pts = (
+        demo_df['reporter_country'].notna().to_numpy() * 10 +
+        demo_df['occp_cod'].notna().to_numpy() * 10
+    )
+    scores = pd.DataFrame(
+        {'total_score': completeness_pts + age_valid_pts + date_valid_pts + reporter_info_pts},
+        index=demo_df.index
     )
-    scores['total_score'] = scores.sum(axis=1)
     
     col1, col2 = st.columns([2, 1])
     
@@ -603,7 +705,7 @@ def show_signal_detection(demo_df, reac_df, drug_df, outc_df):
     """)
     
     with st.spinner("🔍 Calculating PRR signals (analyzing 600 combinations - optimized)..."):
-        signals_df = calculate_prr_signals(drug_df, reac_df, demo_df)
+        signals_df = calculate_prr_signals(ps_drug_reaction(drug_df, reac_df), demo_df)
     
     if len(signals_df) > 0:
         col1, col2 = st.columns([2, 1])
@@ -630,12 +732,10 @@ def show_signal_detection(demo_df, reac_df, drug_df, outc_df):
             st.metric("Average PRR", f"{signals_df['prr'].mean():.2f}")
             
             # Signal strength distribution
-            signals_df['strength'] = pd.cut(
-                signals_df['prr'],
-                bins=[0, 2, 5, 10, float('inf')],
-                labels=['Weak', 'Moderate', 'Strong', 'Very Strong']
-            )
-            strength_counts = signals_df['strength'].value_counts()
+            # Same right-closed bins as pd.cut: (0, 2], (2, 5], (5, 10], (10, inf)
+            strength_labels = np.array(['Weak', 'Moderate', 'Strong', 'Very Strong'])
+            strength_idx = np.digitize(signals_df['prr'].to_numpy(), [2, 5, 10], right=True)
+            strength_counts = pd.Series(strength_labels[strength_idx]).value_counts()
             
             fig = px.pie(
                 values=strength_counts.values,
@@ -716,7 +816,7 @@ def show_signal_detection(demo_df, reac_df, drug_df, outc_df):
     """)
     
     primary_drugs = drug_df[drug_df['role_cod'] == 'PS']
-    top_drugs = primary_drugs['drugname'].value_counts().head(20)
+    top_drugs = primary_drugs['drugname'].value_counts(sort=False).nlargest(20)
     
     fig = px.bar(
         x=top_drugs.values,
@@ -758,7 +858,7 @@ def show_about():
     
     ### 🛠️ Technology Stack
     
-    - **Data Processing:** Pandas, NumPy
+    - **Data Processing:** Pandas, NumPy, PyArrow
     - **Machine Learning:** Scikit-learn
     - **Visualization:** Plotly, Streamlit
     - **Data Source:** FDA FAERS Q3 2025 (Real data)
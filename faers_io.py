@@ -0,0 +1,119 @@
+"""
+Shared FAERS ASCII reader and Parquet parse cache
+Used by the dashboard and the demo scripts in src/
+"""
+
+import os
+import tempfile
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+# Low-cardinality code columns are dictionary-encoded at parse time and
+# arrive in pandas as categoricals (int codes instead of Python strings)
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+
+# Schema metadata entry that tags a cache file with the key it was written under
+CACHE_KEY_FIELD = b'faers_key'
+
+
+def parse_faers_table(path, nrows=None, column_types=None, columns=None):
+    """
+    Parse a $-delimited FAERS ASCII file with Arrow's multithreaded CSV reader
+    Optionally only the first nrows and/or a subset of columns
+    """
+    read_options = pa_csv.ReadOptions(encoding='latin1', block_size=16 << 20)
+    parse_options = pa_csv.ParseOptions(delimiter='$')
+    # strings_can_be_null keeps pandas' empty-field-is-missing semantics
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=columns,
+        column_types=column_types,
+        strings_can_be_null=True
+    )
+    
+    # Parse straight out of the page cache instead of copying through read() buffers
+    with pa.memory_map(str(path)) as source:
+        if nrows is None:
+            return pa_csv.read_csv(
+                source,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options
+            )
+        
+        # Stream record batches and stop once the sample is covered. Types are
+        # inferred from the first block, so callers pin the columns that matter
+        reader = pa_csv.open_csv(
+            source,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options
+        )
+        batches, rows = [], 0
+        while rows < nrows:
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                break
+            batches.append(batch)
+            rows += batch.num_rows
+        return pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows)
+
+
+def make_cache_key(sources, *options):
+    """Cache key from the source files' mtimes and every option that shapes the parsed tables"""
+    return '|'.join(str(part) for part in [[p.stat().st_mtime_ns for p in sources], *options]).encode()
+
+
+def read_cached_table(cache_path, cache_key, filters=None):
+    """Table at cache_path if it was written under cache_key; None if missing, stale or unreadable"""
+    try:
+        if cache_path.exists() and (pq.read_schema(cache_path).metadata or {}).get(CACHE_KEY_FIELD) == cache_key:
+            return pq.read_table(cache_path, filters=filters)
+    except (OSError, pa.ArrowInvalid):
+        pass  # e.g. a file truncated by a crash: treat as a miss and rewrite it
+    return None
+
+
+def write_cached_table(table, cache_path, cache_key, **write_options):
+    """
+    Write table to cache_path tagged with cache_key
+    Writes a uniquely named temporary sibling and renames it, so a failed write never
+    leaves a truncated cache and concurrent writers (app and demos) never share a file
+    """
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), CACHE_KEY_FIELD: cache_key})
+    cache_path.parent.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=cache_path.parent, prefix=cache_path.name + '.',
+                                     suffix='.tmp', delete=False) as tmp:
+        tmp_path = tmp.name
+    try:
+        pq.write_table(table, tmp_path, compression='zstd', **write_options)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        # pyarrow may already have removed its partial output
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def read_faers_table(path, cache_path, nrows=None, column_types=None, columns=None, row_filter=None):
+    """
+    Parse a FAERS ASCII file, reusing the Parquet copy at cache_path while the file
+    and the parse options are unchanged
+    row_filter=(column, values) keeps only rows whose column is in values; on a cache
+    hit it is pushed down into the Parquet scan
+    """
+    cache_key = make_cache_key([path], nrows, column_types, columns)
+    filters = [(row_filter[0], 'in', row_filter[1])] if row_filter is not None else None
+    
+    table = read_cached_table(cache_path, cache_key, filters=filters)
+    if table is None:
+        table = parse_faers_table(path, nrows=nrows, column_types=column_types, columns=columns)
+        write_cached_table(table, cache_path, cache_key)
+        if row_filter is not None:
+            column, values = row_filter
+            table = table.filter(pc.is_in(table[column], value_set=pa.array(values, table[column].type)))
+    
+    return table
@@ -12,12 +12,109 @@ Key Features:
 - Data quality dashboards
 """
 
+import sys
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 import warnings
-warnings.filterwarnings('ignore')
+
+# The shared Arrow reader and Parquet cache live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from faers_io import CATEGORY, make_cache_key, parse_faers_table, read_cached_table, write_cached_table
+except ImportError:  # fall back to the pandas C parser
+    pa = None
+
+# Columns consumed by the monitor; everything else is skipped at parse time
+DEMO_USECOLS = ['caseid', 'fda_dt', 'event_dt', 'age', 'sex', 'reporter_country', 'rept_cod', 'occp_cod']
+REAC_USECOLS = ['primaryid', 'caseid', 'pt']
+DRUG_USECOLS = ['primaryid', 'caseid', 'drug_seq', 'role_cod', 'drugname']
+
+# Declared dtypes for every parsed column, so the C parser needs no inference pass;
+# low-cardinality codes are categorical
+DEMO_DTYPES = {
+    'caseid': 'Int64',
+    'age': 'float32',
+    'sex': 'category',
+    'reporter_country': 'category',
+    'rept_cod': 'category',
+    'occp_cod': 'category',
+    'fda_dt': 'string',
+    'event_dt': 'string'
+}
+REAC_DTYPES = {'primaryid': 'int64', 'caseid': 'Int64', 'pt': 'category'}
+DRUG_DTYPES = {
+    'primaryid': 'int64',
+    'caseid': 'Int64',
+    'drug_seq': 'int64',
+    'drugname': 'category',
+    'role_cod': 'category'
+}
+
+# Set-bit count of every byte value (np.bitwise_count needs NumPy 2)
+POPCOUNT_LUT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int8)
+
+
+def _count_present(present):
+    """Per-row number of present fields, from a packed bitmap of the (N, k) mask"""
+    packed = np.packbits(present, axis=1)
+    return POPCOUNT_LUT[packed].sum(axis=1, dtype=np.int8)
+
+
+def _score_components_numpy(n_present, n_fields, age, rc_nn, occ_nn):
+    """Per-case quality score components as int8 arrays"""
+    # Completeness (40 points)
+    completeness = (n_present.astype(np.int16) * 40 // n_fields).astype(np.int8)
+    
+    # Age validity (20 points)
+    age_valid = np.where(np.isnan(age) | (age > 120), np.int8(0), np.int8(20))
+    
+    # Date consistency (20 points)
+    date_valid = np.full(len(age), 20, dtype=np.int8)
+    # Could add more sophisticated date validation here
+    
+    # Reporter info (20 points)
+    reporter_info = rc_nn.astype(np.int8) * 10 + occ_nn.astype(np.int8) * 10
+    
+    return completeness, age_valid, date_valid, reporter_info
+
+
+@lru_cache(maxsize=None)
+def _numba_score_components():
+    """
+    Compile the Numba version of _score_components_numpy on first use
+    Numba is optional and only imported here; returns None when it is missing
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # Numba is optional; the NumPy scoring path is used instead
+        return None
+    
+    @njit(parallel=True, cache=True)
+    def _score_components_numba(n_present, n_fields, age, rc_nn, occ_nn):
+        """Single-pass, multithreaded version of _score_components_numpy"""
+        n = age.shape[0]
+        completeness = np.empty(n, dtype=np.int8)
+        age_valid = np.empty(n, dtype=np.int8)
+        date_valid = np.full(n, 20, dtype=np.int8)
+        reporter_info = np.empty(n, dtype=np.int8)
+        for i in prange(n):
+            completeness[i] = np.int16(n_present[i]) * 40 // n_fields
+            age_valid[i] = 0 if (np.isnan(age[i]) or age[i] > 120) else 20
+            reporter_info[i] = rc_nn[i] * 10 + occ_nn[i] * 10
+        return completeness, age_valid, date_valid, reporter_info
+    
+    return _score_components_numba
+
+
+# Below this many cases JIT start-up costs more than it saves
+NUMBA_MIN_ROWS = 1_000_000
+
 
 class FAERSDataQualityMonitor:
     """
@@ -32,41 +129,176 @@ class FAERSDataQualityMonitor:
         self.reac_df = None
         self.quality_scores = {}
         
-    def load_data(self, sample_size: int = 50000):
-        """Load FAERS data files"""
+    def load_data(self, sample_size: int = 50000, engine: str = "arrow"):
+        """
+        Load FAERS data files
+        engine="arrow" uses pyarrow's multithreaded CSV reader when available,
+        engine="pandas" forces the pandas C parser
+        """
         print("📥 Loading FAERS Q3 2025 Data...")
         
-        # Load demographics (main table)
-        self.demo_df = pd.read_csv(
-            self.data_path / 'ASCII/DEMO25Q3.txt',
-            sep='$',
-            encoding='latin1',
-            nrows=sample_size,
-            low_memory=False
-        )
+        if pa is None:
+            self._parse_ascii(sample_size, engine)
+        else:
+            # Reuse the Parquet copy of a previous parse while the ASCII files and the
+            # parse options (columns, dtypes) are unchanged
+            ascii_files = [self.data_path / 'ASCII' / f'{name}25Q3.txt' for name in ('DEMO', 'REAC', 'DRUG')]
+            cache_key = make_cache_key(
+                ascii_files, sample_size, engine,
+                DEMO_USECOLS, REAC_USECOLS, DRUG_USECOLS, DEMO_DTYPES, REAC_DTYPES, DRUG_DTYPES
+            )
+            if not self._read_parquet_cache(cache_key):
+                self._parse_ascii(sample_size, engine)
+                self._write_parquet_cache(cache_key)
+        
+        # Sorted caseid index: duplicate checks become adjacent comparisons
+        self.demo_df = self.demo_df.sort_values('caseid', kind='stable').set_index('caseid', drop=False)
+        
+        # Parse receipt dates once for every downstream check
+        self._parse_dates()
         
-        # Load reactions
-        self.reac_df = pd.read_csv(
-            self.data_path / 'ASCII/REAC25Q3.txt',
+        print(f"✅ Loaded {len(self.demo_df):,} cases")
+        print(f"   - {len(self.reac_df):,} adverse reactions")
+        print(f"   - {len(self.drug_df):,} drug records")
+        print()
+    
+    def _parse_ascii(self, sample_size: int, engine: str):
+        """Parse the DEMO sample and its reactions and drugs from the ASCII files"""
+        if engine == "arrow" and pa is not None:
+            # Demographics: only the first sample_size rows, with the monitored columns pinned
+            self.demo_df = self._read_arrow(
+                self.data_path / 'ASCII/DEMO25Q3.txt',
+                nrows=sample_size,
+                usecols=DEMO_USECOLS,
+                column_types={
+                    'caseid': pa.int64(),
+                    'age': pa.float32(),
+                    'fda_dt': pa.string(),
+                    'event_dt': pa.string(),
+                    'sex': CATEGORY,
+                    'reporter_country': CATEGORY,
+                    'rept_cod': CATEGORY,
+                    'occp_cod': CATEGORY
+                }
+            )
+            # Reactions and drugs are only ever looked at for the sampled cases
+            caseids = self.demo_df['caseid'].dropna().unique()
+            self.reac_df = self._read_arrow(
+                self.data_path / 'ASCII/REAC25Q3.txt',
+                usecols=REAC_USECOLS,
+                column_types={'pt': CATEGORY},
+                caseids=caseids
+            )
+            self.drug_df = self._read_arrow(
+                self.data_path / 'ASCII/DRUG25Q3.txt',
+                usecols=DRUG_USECOLS,
+                column_types={
+                    'drugname': CATEGORY,
+                    'role_cod': CATEGORY
+                },
+                caseids=caseids
+            )
+        else:
+            # Load demographics (main table): the first chunk is the sample
+            with pd.read_csv(
+                self.data_path / 'ASCII/DEMO25Q3.txt',
+                sep='$',
+                encoding='latin1',
+                usecols=DEMO_USECOLS,
+                dtype=DEMO_DTYPES,
+                chunksize=sample_size,
+                engine='c',
+                memory_map=True
+            ) as reader:
+                self.demo_df = next(reader)
+            
+            # Load reactions and drugs in chunks, keeping only the sampled cases
+            caseids = self.demo_df['caseid'].dropna().unique()
+            self.reac_df = self._read_pandas_for_cases(
+                self.data_path / 'ASCII/REAC25Q3.txt', REAC_USECOLS, REAC_DTYPES, caseids
+            )
+            self.drug_df = self._read_pandas_for_cases(
+                self.data_path / 'ASCII/DRUG25Q3.txt', DRUG_USECOLS, DRUG_DTYPES, caseids
+            )
+    
+    def _cache_paths(self):
+        """Parquet cache locations for the demo, reaction and drug tables"""
+        cache_dir = self.data_path / 'cache'
+        return {name: cache_dir / f'quality_{name}25q3.parquet' for name in ('demo', 'reac', 'drug')}
+    
+    def _read_parquet_cache(self, cache_key: bytes) -> bool:
+        """Load all three tables from the Parquet cache if every file matches cache_key"""
+        # A set left half-rewritten carries two keys, so it is a miss too
+        tables = {name: read_cached_table(path, cache_key) for name, path in self._cache_paths().items()}
+        if any(table is None for table in tables.values()):
+            return False
+        
+        self.demo_df = tables['demo'].to_pandas()
+        self.reac_df = tables['reac'].to_pandas()
+        self.drug_df = tables['drug'].to_pandas()
+        return True
+    
+    def _write_parquet_cache(self, cache_key: bytes):
+        """Write the freshly parsed tables to the Parquet cache, tagged with cache_key"""
+        paths = self._cache_paths()
+        for name, df in (('demo', self.demo_df), ('reac', self.reac_df), ('drug', self.drug_df)):
+            # Keep the pandas metadata so categorical/nullable dtypes round-trip
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            write_cached_table(table, paths[name], cache_key, row_group_size=128_000)
+    
+    def _parse_dates(self):
+        """Parse the FDA receipt date into fda_dt_parsed if not already done"""
+        if 'fda_dt_parsed' not in self.demo_df.columns:
+            # Receipt dates repeat heavily, so parse each distinct value once
+            codes, uniques = pd.factorize(self.demo_df['fda_dt'])
+            with warnings.catch_warnings():
+                # Malformed dates become NaT and are reported separately
+                warnings.simplefilter('ignore')
+                parsed = pd.to_datetime(uniques, format='%Y%m%d', errors='coerce')
+            self.demo_df['fda_dt_parsed'] = parsed.take(
+                codes, allow_fill=True, fill_value=pd.NaT
+            ).to_numpy()
+    
+    def _read_pandas_for_cases(self, path: Path, usecols: list, dtype: dict, caseids: np.ndarray):
+        """Stream a FAERS file with pandas, keeping only rows for the given caseids"""
+        chunks = pd.read_csv(
+            path,
             sep='$',
             encoding='latin1',
-            low_memory=False
+            usecols=usecols,
+            dtype=dtype,
+            chunksize=500_000,
+            engine='c',
+            memory_map=True
         )
+        with chunks:
+            df = pd.concat(
+                [chunk[chunk['caseid'].isin(caseids)] for chunk in chunks],
+                ignore_index=True
+            )
+        # Each chunk carries its own categories, so concat falls back to object
+        return df.astype(dtype)
+    
+    def _read_arrow(self, path: Path, nrows: int = None, column_types: dict = None,
+                    usecols: list = None, caseids: np.ndarray = None):
+        """
+        Read a $-delimited FAERS file with pyarrow
+        Optionally only the first nrows, a subset of columns, or the rows for given caseids
+        """
+        table = parse_faers_table(path, nrows=nrows, column_types=column_types, columns=usecols)
         
-        # Load drugs
-        self.drug_df = pd.read_csv(
-            self.data_path / 'ASCII/DRUG25Q3.txt',
-            sep='$',
-            encoding='latin1',
-            low_memory=False
-        )
+        if caseids is not None:
+            table = table.filter(pc.is_in(table['caseid'], value_set=pa.array(caseids, pa.int64())))
         
-        print(f"✅ Loaded {len(self.demo_df):,} cases")
-        print(f"   - {len(self.reac_df):,} adverse reactions")
-        print(f"   - {len(self.drug_df):,} drug records")
-        print()
+        return table.to_pandas()
         
-    def calculate_completeness_score(self):
+    def _missing_mask(self, columns, isna_matrix=None):
+        """(N, k) missing-value mask for columns, sliced from a shared isna matrix when given"""
+        if isna_matrix is None:
+            return self.demo_df[columns].isna().to_numpy()
+        return isna_matrix[:, self.demo_df.columns.get_indexer(columns)]
+    
+    def calculate_completeness_score(self, isna_matrix=None):
         """
         Calculate data completeness score for critical fields
         This is a key data quality metric for regulatory compliance
@@ -83,12 +315,10 @@ class FAERSDataQualityMonitor:
             'Report Code': 'rept_cod'
         }
         
-        completeness = {}
-        for name, col in critical_fields.items():
-            if col in self.demo_df.columns:
-                non_null = self.demo_df[col].notna().sum()
-                total = len(self.demo_df)
-                completeness[name] = (non_null / total) * 100
+        present = {name: col for name, col in critical_fields.items() if col in self.demo_df.columns}
+        missing = self._missing_mask(list(present.values()), isna_matrix).sum(axis=0)
+        non_null = len(self.demo_df) - missing
+        completeness = dict(zip(present, non_null / len(self.demo_df) * 100))
         
         # Overall score
         overall_score = np.mean(list(completeness.values()))
@@ -111,16 +341,29 @@ class FAERSDataQualityMonitor:
         print("\n🔎 Detecting Duplicate Cases...")
         
         # Check for exact case ID duplicates
-        duplicate_cases = self.demo_df[self.demo_df.duplicated(subset=['caseid'], keep=False)]
-        
-        # Check for potential duplicates based on multiple criteria
-        potential_dupes = self.demo_df[
-            self.demo_df.duplicated(
-                subset=['age', 'sex', 'event_dt', 'reporter_country'],
-                keep=False
-            ) & 
-            self.demo_df['age'].notna()
-        ]
+        if self.demo_df.index.name == 'caseid' and self.demo_df.index.is_monotonic_increasing:
+            # Equal caseids sit next to each other in the sorted index
+            ids = self.demo_df.index.to_numpy(dtype=np.int64)
+            same_as_next = ids[1:] == ids[:-1]
+            dup_mask_id = np.zeros(len(ids), dtype=bool)
+            dup_mask_id[1:] |= same_as_next
+            dup_mask_id[:-1] |= same_as_next
+        else:
+            dup_mask_id = self.demo_df['caseid'].duplicated(keep=False).to_numpy()
+        
+        # Check for potential duplicates based on multiple criteria: one 64-bit
+        # hash per row of the key columns; counts[inverse] is then each row's group
+        # size, i.e. groupby(key_cols, dropna=False).transform('size') in one pass
+        key_cols = self.demo_df[['age', 'sex', 'event_dt', 'reporter_country']]
+        # -0.0 + 0.0 == +0.0, so both zeros hash alike (duplicated treats them as equal)
+        key_cols = key_cols.assign(age=key_cols['age'] + 0.0)
+        row_keys = pd.util.hash_pandas_object(key_cols, index=False).to_numpy()
+        _, inverse, counts = np.unique(row_keys, return_inverse=True, return_counts=True)
+        dup_mask_fuzzy = (counts[inverse] > 1) & self.demo_df['age'].notna().to_numpy()
+        
+        # Index views of the flagged rows rather than copies of the frame
+        duplicate_cases = self.demo_df.index[dup_mask_id]
+        potential_dupes = self.demo_df.index[dup_mask_fuzzy]
         
         print(f"  📋 Exact duplicates (case ID): {len(duplicate_cases):,} records")
         print(f"  🔍 Potential duplicates: {len(potential_dupes):,} records")
@@ -135,38 +378,41 @@ class FAERSDataQualityMonitor:
         """
         print("\n📈 Analyzing Temporal Reporting Patterns...")
         
-        # Convert FDA receipt date to datetime
-        self.demo_df['fda_dt_parsed'] = pd.to_datetime(
-            self.demo_df['fda_dt'],
-            format='%Y%m%d',
-            errors='coerce'
-        )
+        self._parse_dates()
         
         # Daily report counts
-        daily_counts = self.demo_df.groupby(
-            self.demo_df['fda_dt_parsed'].dt.date
-        ).size().reset_index(name='count')
+        days = self.demo_df['fda_dt_parsed'].to_numpy().astype('datetime64[D]')
+        days, counts = np.unique(days[~np.isnat(days)], return_counts=True)
         
         # Calculate Z-scores for anomaly detection
-        mean_count = daily_counts['count'].mean()
-        std_count = daily_counts['count'].std()
-        daily_counts['z_score'] = (daily_counts['count'] - mean_count) / std_count
+        with warnings.catch_warnings():
+            # A single reporting day has no spread (std and z-scores are NaN)
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean_count = counts.mean()
+            std_count = counts.std(ddof=1)
+            z_scores = (counts - mean_count) / std_count
+        
+        daily_counts = pd.DataFrame({
+            'fda_dt_parsed': days,
+            'count': counts,
+            'z_score': z_scores
+        })
         
         # Identify anomalies (|Z| > 3)
-        anomalies = daily_counts[abs(daily_counts['z_score']) > 3]
+        anomalies = daily_counts[np.abs(z_scores) > 3]
         
-        print(f"  📅 Date range: {daily_counts.iloc[0, 0]} to {daily_counts.iloc[-1, 0]}")
+        print(f"  📅 Date range: {days[0]} to {days[-1]}")
         print(f"  📊 Average daily reports: {mean_count:.0f} ± {std_count:.0f}")
         print(f"  🚨 Anomalous days detected: {len(anomalies)}")
         
         if len(anomalies) > 0:
             print("\n  Top 3 anomalous days:")
             for idx, row in anomalies.nlargest(3, 'count').iterrows():
-                print(f"    - {row.iloc[0]}: {row['count']:,} reports (Z={row['z_score']:.2f})")
+                print(f"    - {row['fda_dt_parsed']:%Y-%m-%d}: {row['count']:,} reports (Z={row['z_score']:.2f})")
         
         return daily_counts, anomalies
     
-    def profile_missing_data_patterns(self):
+    def profile_missing_data_patterns(self, isna_matrix=None):
         """
         Analyze patterns in missing data
         Helps identify systematic data entry issues
@@ -174,11 +420,11 @@ class FAERSDataQualityMonitor:
         print("\n🔍 Profiling Missing Data Patterns...")
         
         # Calculate missing percentages
+        missing = self._missing_mask(list(self.demo_df.columns), isna_matrix).sum(axis=0)
         missing_stats = pd.DataFrame({
             'column': self.demo_df.columns,
-            'missing_count': [self.demo_df[col].isna().sum() for col in self.demo_df.columns],
-            'missing_pct': [(self.demo_df[col].isna().sum() / len(self.demo_df) * 100) 
-                           for col in self.demo_df.columns]
+            'missing_count': missing,
+            'missing_pct': missing / len(self.demo_df) * 100
         })
         
         missing_stats = missing_stats[missing_stats['missing_pct'] > 0].sort_values(
@@ -192,40 +438,41 @@ class FAERSDataQualityMonitor:
         
         return missing_stats
     
-    def calculate_case_quality_score(self):
+    def calculate_case_quality_score(self, isna_matrix=None):
         """
         Calculate individual case quality scores
         This can be used for prioritization and automated review
         """
         print("\n⭐ Calculating Individual Case Quality Scores...")
         
-        # Quality scoring criteria
-        scores = pd.DataFrame(index=self.demo_df.index)
-        
-        # Completeness (40 points)
+        # Quality scoring criteria, one int8 array per component
         critical_fields = ['caseid', 'fda_dt', 'age', 'sex', 'reporter_country']
-        scores['completeness'] = self.demo_df[critical_fields].notna().sum(axis=1) / len(critical_fields) * 40
-        
-        # Age validity (20 points)
-        scores['age_valid'] = 20
-        scores.loc[self.demo_df['age'].isna(), 'age_valid'] = 0
-        scores.loc[self.demo_df['age'] > 120, 'age_valid'] = 0
-        
-        # Date consistency (20 points)
-        scores['date_valid'] = 20
-        # Could add more sophisticated date validation here
         
-        # Reporter info (20 points)
-        scores['reporter_info'] = (
-            self.demo_df['reporter_country'].notna().astype(int) * 10 +
-            self.demo_df['occp_cod'].notna().astype(int) * 10
+        n_present = _count_present(~self._missing_mask(critical_fields, isna_matrix))
+        age = self.demo_df['age'].to_numpy(dtype=np.float32)
+        rc_nn, occ_nn = (~self._missing_mask(['reporter_country', 'occp_cod'], isna_matrix)).T
+        
+        score_components = None
+        if len(age) >= NUMBA_MIN_ROWS:
+            score_components = _numba_score_components()
+        if score_components is None:
+            score_components = _score_components_numpy
+        completeness, age_valid, date_valid, reporter_info = score_components(
+            n_present, len(critical_fields), age, rc_nn, occ_nn
         )
         
         # Total score
-        scores['total_score'] = scores.sum(axis=1)
+        total_score = completeness + age_valid + date_valid + reporter_info
+        scores = pd.DataFrame({
+            'completeness': completeness,
+            'age_valid': age_valid,
+            'date_valid': date_valid,
+            'reporter_info': reporter_info,
+            'total_score': total_score
+        }, index=self.demo_df.index)
         
         # Add to demo_df
-        self.demo_df['quality_score'] = scores['total_score']
+        self.demo_df['quality_score'] = total_score
         
         # Summary statistics
         print(f"  📊 Mean Quality Score: {scores['total_score'].mean():.2f}/100")
@@ -253,11 +500,7 @@ class FAERSDataQualityMonitor:
         
         # Issue 2: Future dates
         current_date = datetime.now()
-        self.demo_df['fda_dt_parsed'] = pd.to_datetime(
-            self.demo_df['fda_dt'],
-            format='%Y%m%d',
-            errors='coerce'
-        )
+        self._parse_dates()
         future_dates = self.demo_df[
             self.demo_df['fda_dt_parsed'] > current_date
         ]
@@ -281,12 +524,15 @@ class FAERSDataQualityMonitor:
         print("📋 FDA FAERS DATA QUALITY REPORT - Q3 2025")
         print("="*60)
         
+        # One missing-value scan shared by the completeness, profile and scoring checks
+        isna_matrix = self.demo_df.isna().to_numpy()
+        
         # Run all checks
-        completeness = self.calculate_completeness_score()
+        completeness = self.calculate_completeness_score(isna_matrix)
         duplicates = self.detect_duplicates()
         temporal_analysis = self.detect_anomalies_in_reporting_patterns()
-        missing_profile = self.profile_missing_data_patterns()
-        quality_scores = self.calculate_case_quality_score()
+        missing_profile = self.profile_missing_data_patterns(isna_matrix)
+        quality_scores = self.calculate_case_quality_score(isna_matrix)
         issues = self.identify_data_entry_issues()
         
         print("\n" + "="*60)
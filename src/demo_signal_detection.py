@@ -12,6 +12,10 @@ Key Features:
 - ML-based signal prioritization
 """
 
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -19,6 +23,99 @@ from collections import Counter
 import warnings
 warnings.filterwarnings('ignore')
 
+# The shared Arrow reader and Parquet cache live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+try:
+    import pyarrow as pa
+    from faers_io import CATEGORY, read_faers_table
+except ImportError:  # fall back to the pandas C parser
+    pa = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy path below is used instead
+    njit = None
+
+# Columns used by the analyses
+DEMO_USECOLS = ['primaryid', 'caseid', 'fda_dt', 'age', 'sex', 'occp_cod', 'rept_cod']
+DRUG_USECOLS = ['primaryid', 'caseid', 'role_cod', 'drugname']
+REAC_USECOLS = ['primaryid', 'caseid', 'pt']
+OUTC_USECOLS = ['primaryid', 'caseid', 'outc_cod']
+
+# Declared dtypes, so the C parser needs no inference pass; low-cardinality codes
+# are categoricals. fda_dt and caseid are left to inference: a missing date or
+# case id must become NaN rather than fail an integer parse.
+# Ages can be fractional or in months/days, so age is float32 rather than an integer
+ID_DTYPES = {'primaryid': 'int64'}
+DEMO_DTYPES = {**ID_DTYPES, 'age': 'float32', 'sex': 'category', 'occp_cod': 'category', 'rept_cod': 'category'}
+DRUG_DTYPES = {**ID_DTYPES, 'role_cod': 'category', 'drugname': 'category'}
+REAC_DTYPES = {**ID_DTYPES, 'pt': 'category'}
+OUTC_DTYPES = {**ID_DTYPES, 'outc_cod': 'category'}
+
+# Outcome codes that make a report serious
+SERIOUS_OUTCOMES = {
+    'DE': 'Death',
+    'LT': 'Life-Threatening',
+    'HO': 'Hospitalization',
+    'DS': 'Disability',
+    'CA': 'Congenital Anomaly',
+    'RI': 'Required Intervention'
+}
+
+
+def _prr_chi2_numpy(a, drug_totals, reaction_totals, total_cases, min_cases):
+    """PRR and chi-square for a drugs × reactions matrix of report counts (0 where undefined)"""
+    b = drug_totals[:, None] - a
+    c = reaction_totals[None, :] - a
+    d = total_cases - a - b - c
+    
+    valid = (a >= min_cases) & (b > 0) & (c > 0) & (d > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        prr = np.where(valid, (a / b) / (c / d), 0.0)
+        chi2 = np.where(
+            valid,
+            total_cases * (a*d - b*c)**2 / ((a+b)*(c+d)*(a+c)*(b+d)),
+            0.0
+        )
+    return prr, chi2
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _prr_chi2_numba(a, drug_totals, reaction_totals, total_cases, min_cases):
+        """Fused single-pass version of _prr_chi2_numpy, parallel over drugs"""
+        n_drugs, n_reactions = a.shape
+        prr = np.zeros(a.shape)
+        chi2 = np.zeros(a.shape)
+        for i in prange(n_drugs):
+            for j in range(n_reactions):
+                a_ij = a[i, j]
+                b = drug_totals[i] - a_ij
+                c = reaction_totals[j] - a_ij
+                d = total_cases - a_ij - b - c
+                if a_ij >= min_cases and b > 0 and c > 0 and d > 0:
+                    prr[i, j] = (a_ij / b) / (c / d)
+                    chi2[i, j] = total_cases * (a_ij*d - b*c)**2 / ((a_ij+b)*(c+d)*(a_ij+c)*(b+d))
+        return prr, chi2
+
+
+def _count_distinct(values: pd.Series) -> int:
+    """
+    Number of distinct values, missing counted as one, like len(values.unique())
+    Categoricals are counted from their codes: the categories come from the whole
+    file, so they can include values that only occur in reports outside the sample
+    (with the default 100k sample every drug and reaction occurs and both agree)
+    """
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return values.nunique(dropna=False)
+    codes = values.cat.codes.to_numpy().astype(np.intp)
+    return int(np.count_nonzero(np.bincount(codes + 1)))
+
+
+# Below this many drug/reaction cells JIT start-up costs more than it saves
+NUMBA_MIN_CELLS = 100_000
+
 
 class SafetySignalDetector:
     """
@@ -34,39 +131,38 @@ class SafetySignalDetector:
         self.outc_df = None
         self.signals = []
         
+        # Joins shared by several analyses, built on first use; report stages
+        # run concurrently, so each is built under its own lock
+        self._drug_reac_ps = None
+        self._demo_outc = None
+        self._serious_mask = None
+        self._drug_reac_lock = threading.Lock()
+        self._demo_outc_lock = threading.Lock()
+        self._serious_lock = threading.Lock()
+        
+        # Report output buffer; None prints straight to stdout. Stage threads
+        # print into their own buffer, kept in thread-local storage
+        self._out = None
+        self._local = threading.local()
+        
     def load_data(self, sample_size: int = 100000):
         """Load FAERS data files"""
         print("📥 Loading FAERS Data for Signal Detection...")
         
         # Load all necessary tables
-        self.demo_df = pd.read_csv(
-            self.data_path / 'ASCII/DEMO25Q3.txt',
-            sep='$',
-            encoding='latin1',
-            nrows=sample_size,
-            low_memory=False
-        )
+        self.demo_df = self._read_faers('DEMO', DEMO_USECOLS, DEMO_DTYPES, nrows=sample_size)
+        # YYYYMMDD dates fit in int32 once no date is missing
+        self.demo_df['fda_dt'] = pd.to_numeric(self.demo_df['fda_dt'], downcast='integer')
         
-        self.reac_df = pd.read_csv(
-            self.data_path / 'ASCII/REAC25Q3.txt',
-            sep='$',
-            encoding='latin1',
-            low_memory=False
-        )
-        
-        self.drug_df = pd.read_csv(
-            self.data_path / 'ASCII/DRUG25Q3.txt',
-            sep='$',
-            encoding='latin1',
-            low_memory=False
-        )
+        # Only keep reactions, drugs and outcomes of the sampled reports
+        primaryids = self.demo_df['primaryid'].unique()
+        self.reac_df = self._read_faers('REAC', REAC_USECOLS, REAC_DTYPES, primaryids=primaryids)
+        self.drug_df = self._read_faers('DRUG', DRUG_USECOLS, DRUG_DTYPES, primaryids=primaryids)
+        self.outc_df = self._read_faers('OUTC', OUTC_USECOLS, OUTC_DTYPES, primaryids=primaryids)
         
-        self.outc_df = pd.read_csv(
-            self.data_path / 'ASCII/OUTC25Q3.txt',
-            sep='$',
-            encoding='latin1',
-            low_memory=False
-        )
+        self._drug_reac_ps = None
+        self._demo_outc = None
+        self._serious_mask = None
         
         print(f"✅ Loaded data:")
         print(f"   - {len(self.demo_df):,} cases")
@@ -75,6 +171,102 @@ class SafetySignalDetector:
         print(f"   - {len(self.outc_df):,} outcomes")
         print()
         
+    def _read_faers(self, name: str, usecols: list, dtypes: dict, nrows: int = None,
+                    primaryids: np.ndarray = None):
+        """
+        Read one $-delimited FAERS table, with pyarrow's multithreaded reader when available
+        Optionally only the first nrows, or only the rows for the given primaryids
+        """
+        path = self.data_path / f'ASCII/{name}25Q3.txt'
+        
+        if pa is None:
+            if primaryids is None:
+                return pd.read_csv(
+                    path,
+                    sep='$',
+                    encoding='latin1',
+                    usecols=usecols,
+                    dtype=dtypes,
+                    nrows=nrows
+                )
+            
+            # Stream in chunks so only one chunk plus the kept rows are in memory
+            chunks = pd.read_csv(
+                path,
+                sep='$',
+                encoding='latin1',
+                usecols=usecols,
+                dtype=dtypes,
+                chunksize=500_000
+            )
+            with chunks:
+                df = pd.concat(
+                    [chunk[chunk['primaryid'].isin(primaryids)] for chunk in chunks],
+                    ignore_index=True
+                )
+            # Each chunk carries its own categories, so concat falls back to object
+            return df.astype(dtypes)
+        
+        # Reuse the Parquet copy of a previous parse while the ASCII file is unchanged;
+        # categoricals are read as dictionary arrays
+        suffix = f'.{nrows}' if nrows is not None else ''
+        table = read_faers_table(
+            path,
+            self.data_path / 'cache' / f'signal_{name.lower()}25q3{suffix}.parquet',
+            nrows=nrows,
+            column_types={
+                col: CATEGORY if dtype == 'category' else pa.from_numpy_dtype(np.dtype(dtype))
+                for col, dtype in dtypes.items()
+            },
+            columns=usecols,
+            row_filter=('primaryid', primaryids) if primaryids is not None else None
+        )
+        return table.to_pandas()
+    
+    def _p(self, *args):
+        """print() into the report buffer while a report is being generated"""
+        print(*args, file=getattr(self._local, 'out', self._out))
+    
+    def _get_drug_reac_ps(self):
+        """Primary-suspect drug records joined with their reactions (cached)"""
+        with self._drug_reac_lock:
+            if self._drug_reac_ps is None:
+                # Filter before the join so the hash table is built on the PS rows only
+                self._drug_reac_ps = self.drug_df[self.drug_df['role_cod'] == 'PS'].merge(
+                    self.reac_df,
+                    on=['primaryid', 'caseid'],
+                    how='inner'
+                )
+        return self._drug_reac_ps
+    
+    def _get_demo_outc(self):
+        """Cases left-joined with their outcomes (cached)"""
+        with self._demo_outc_lock:
+            if self._demo_outc is None:
+                self._demo_outc = self.demo_df.merge(
+                    self.outc_df,
+                    on=['primaryid', 'caseid'],
+                    how='left'
+                )
+        return self._demo_outc
+    
+    def _get_serious_mask(self):
+        """Boolean mask of serious outcomes over the cases/outcomes join (cached)"""
+        with self._serious_lock:
+            if self._serious_mask is None:
+                outc_cod = self._get_demo_outc()['outc_cod']
+                if isinstance(outc_cod.dtype, pd.CategoricalDtype):
+                    # Gather from a per-category lookup table; the extra last slot
+                    # stays False and is what code -1 (missing outcome) indexes
+                    categories = outc_cod.cat.categories
+                    serious_idx = [categories.get_loc(code) for code in SERIOUS_OUTCOMES if code in categories]
+                    lookup = np.zeros(len(categories) + 1, dtype=bool)
+                    lookup[serious_idx] = True
+                    self._serious_mask = lookup[outc_cod.cat.codes.to_numpy()]
+                else:
+                    self._serious_mask = outc_cod.isin(list(SERIOUS_OUTCOMES)).to_numpy()
+        return self._serious_mask
+    
     def calculate_prr(self, min_cases: int = 3):
         """
         Calculate Proportional Reporting Ratio (PRR)
@@ -87,82 +279,68 @@ class SafetySignalDetector:
         c = reports with NOT drug X and event Y
         d = reports with NOT drug X and NOT event Y
         """
-        print("🔍 Calculating Proportional Reporting Ratios (PRR)...")
+        self._p("🔍 Calculating Proportional Reporting Ratios (PRR)...")
         
-        # Merge drug and reaction data
-        drug_reaction = self.drug_df.merge(
-            self.reac_df,
-            on=['primaryid', 'caseid'],
-            how='inner'
-        )
+        # Primary suspect drugs joined with their reactions
+        drug_reaction = self._get_drug_reac_ps()
         
-        # Filter for primary suspect drugs only
-        drug_reaction = drug_reaction[drug_reaction['role_cod'] == 'PS']
+        # Get top drugs and reactions for analysis (nlargest avoids sorting every count)
+        drug_counts = drug_reaction['drugname'].value_counts(sort=False)
+        reaction_counts = drug_reaction['pt'].value_counts(sort=False)
+        top_drugs = drug_counts.nlargest(50).index
+        top_reactions = reaction_counts.nlargest(100).index
         
-        # Get top drugs and reactions for analysis
-        top_drugs = drug_reaction['drugname'].value_counts().head(50).index
-        top_reactions = drug_reaction['pt'].value_counts().head(100).index
+        self._p(f"  Analyzing {len(top_drugs)} drugs × {len(top_reactions)} reactions...")
         
-        signals = []
+        total_cases = len(self.demo_df)
         
-        print(f"  Analyzing {len(top_drugs)} drugs × {len(top_reactions)} reactions...")
+        # Calculate all 2x2 contingency tables at once (drugs × reactions)
+        # observed=True counts only the pairs that occur instead of every category combination
+        in_scope = drug_reaction['drugname'].isin(top_drugs) & drug_reaction['pt'].isin(top_reactions)
+        a = (
+            drug_reaction[in_scope]
+            .groupby(['drugname', 'pt'], observed=True, sort=False)
+            .size()
+            .unstack(fill_value=0)
+            .reindex(index=top_drugs, columns=top_reactions, fill_value=0)
+            .to_numpy(dtype=np.float64)
+        )
         
-        total_cases = len(self.demo_df)
+        # b and c count the drug / reaction over all reports, not just the top ones
+        drug_totals = drug_counts.reindex(top_drugs).to_numpy(dtype=np.float64)
+        reaction_totals = reaction_counts.reindex(top_reactions).to_numpy(dtype=np.float64)
         
-        for drug in top_drugs:
-            for reaction in top_reactions:
-                # Calculate 2x2 contingency table
-                a = len(drug_reaction[
-                    (drug_reaction['drugname'] == drug) & 
-                    (drug_reaction['pt'] == reaction)
-                ])
-                
-                if a < min_cases:
-                    continue
-                
-                b = len(drug_reaction[
-                    (drug_reaction['drugname'] == drug) & 
-                    (drug_reaction['pt'] != reaction)
-                ])
-                
-                c = len(drug_reaction[
-                    (drug_reaction['drugname'] != drug) & 
-                    (drug_reaction['pt'] == reaction)
-                ])
-                
-                d = total_cases - a - b - c
-                
-                # Calculate PRR
-                if b > 0 and c > 0 and d > 0:
-                    prr = (a / b) / (c / d)
-                    
-                    # Calculate Chi-square for statistical significance
-                    chi2 = total_cases * (a*d - b*c)**2 / ((a+b)*(c+d)*(a+c)*(b+d))
-                    
-                    # Signal criteria: PRR >= 2, chi2 >= 4, cases >= 3
-                    if prr >= 2.0 and chi2 >= 4.0:
-                        signals.append({
-                            'drug': drug,
-                            'reaction': reaction,
-                            'prr': prr,
-                            'chi2': chi2,
-                            'cases': a,
-                            'signal_strength': 'Strong' if prr >= 5 else 'Moderate'
-                        })
+        # Calculate PRR and Chi-square for statistical significance
+        if njit is not None and a.size >= NUMBA_MIN_CELLS:
+            prr_chi2 = _prr_chi2_numba
+        else:
+            prr_chi2 = _prr_chi2_numpy
+        prr, chi2 = prr_chi2(a, drug_totals, reaction_totals, float(total_cases), float(min_cases))
+        
+        # Signal criteria: PRR >= 2, chi2 >= 4, cases >= min_cases (prr is 0 otherwise)
+        rows, cols = np.nonzero((prr >= 2.0) & (chi2 >= 4.0))
+        signals_df = pd.DataFrame({
+            'drug': np.asarray(top_drugs)[rows],
+            'reaction': np.asarray(top_reactions)[cols],
+            'prr': prr[rows, cols],
+            'chi2': chi2[rows, cols],
+            'cases': a[rows, cols].astype(np.int64),
+            'signal_strength': np.where(prr[rows, cols] >= 5, 'Strong', 'Moderate')
+        })
         
         # Sort by PRR
-        signals_df = pd.DataFrame(signals).sort_values('prr', ascending=False)
+        signals_df = signals_df.sort_values('prr', ascending=False)
         
-        print(f"\n  🚨 Detected {len(signals_df)} potential safety signals!")
-        print(f"  📊 Signal criteria: PRR ≥ 2.0, χ² ≥ 4.0, cases ≥ {min_cases}")
+        self._p(f"\n  🚨 Detected {len(signals_df)} potential safety signals!")
+        self._p(f"  📊 Signal criteria: PRR ≥ 2.0, χ² ≥ 4.0, cases ≥ {min_cases}")
         
         if len(signals_df) > 0:
-            print("\n  🔝 Top 10 Strongest Signals:")
-            print()
+            self._p("\n  🔝 Top 10 Strongest Signals:")
+            self._p()
             for idx, row in signals_df.head(10).iterrows():
-                print(f"    {row['signal_strength']:8s} | {row['drug'][:30]:30s} → {row['reaction'][:30]:30s}")
-                print(f"              PRR: {row['prr']:6.2f} | χ²: {row['chi2']:8.2f} | Cases: {row['cases']:4.0f}")
-                print()
+                self._p(f"    {row['signal_strength']:8s} | {row['drug'][:30]:30s} → {row['reaction'][:30]:30s}")
+                self._p(f"              PRR: {row['prr']:6.2f} | χ²: {row['chi2']:8.2f} | Cases: {row['cases']:4.0f}")
+                self._p()
         
         self.signals = signals_df
         return signals_df
@@ -172,40 +350,27 @@ class SafetySignalDetector:
         Identify cases with serious outcomes
         Critical for prioritizing safety review
         """
-        print("\n⚠️  Analyzing Serious Outcomes...")
+        self._p("\n⚠️  Analyzing Serious Outcomes...")
         
         # Merge outcomes with demo data
-        cases_with_outcomes = self.demo_df.merge(
-            self.outc_df,
-            on=['primaryid', 'caseid'],
-            how='left'
-        )
+        cases_with_outcomes = self._get_demo_outc()
         
-        # Define serious outcome codes
-        serious_codes = {
-            'DE': 'Death',
-            'LT': 'Life-Threatening',
-            'HO': 'Hospitalization',
-            'DS': 'Disability',
-            'CA': 'Congenital Anomaly',
-            'RI': 'Required Intervention'
+        # Count serious outcomes (all codes in one pass)
+        outcome_counts = cases_with_outcomes['outc_cod'].value_counts()
+        serious_counts = {
+            description: int(outcome_counts.get(code, 0))
+            for code, description in SERIOUS_OUTCOMES.items()
         }
         
-        # Count serious outcomes
-        serious_counts = {}
-        for code, description in serious_codes.items():
-            count = (cases_with_outcomes['outc_cod'] == code).sum()
-            serious_counts[description] = count
-        
-        total_serious = cases_with_outcomes['outc_cod'].isin(serious_codes.keys()).sum()
+        total_serious = sum(serious_counts.values())
         
-        print(f"  📊 Total cases with serious outcomes: {total_serious:,}")
-        print(f"  📊 Serious outcome rate: {(total_serious/len(cases_with_outcomes)*100):.2f}%")
-        print("\n  Breakdown by outcome type:")
+        self._p(f"  📊 Total cases with serious outcomes: {total_serious:,}")
+        self._p(f"  📊 Serious outcome rate: {(total_serious/len(cases_with_outcomes)*100):.2f}%")
+        self._p("\n  Breakdown by outcome type:")
         for outcome, count in sorted(serious_counts.items(), key=lambda x: x[1], reverse=True):
             if count > 0:
                 pct = (count / len(cases_with_outcomes) * 100)
-                print(f"    {outcome:25s}: {count:6,} ({pct:5.2f}%)")
+                self._p(f"    {outcome:25s}: {count:6,} ({pct:5.2f}%)")
         
         return cases_with_outcomes, serious_counts
     
@@ -214,37 +379,42 @@ class SafetySignalDetector:
         Analyze temporal trends in adverse event reporting
         Can detect emerging safety signals
         """
-        print("\n📈 Temporal Signal Analysis...")
-        
-        # Parse dates
-        self.demo_df['fda_dt_parsed'] = pd.to_datetime(
-            self.demo_df['fda_dt'],
-            format='%Y%m%d',
-            errors='coerce'
-        )
-        
-        # Monthly aggregation
-        monthly = self.demo_df.groupby(
-            self.demo_df['fda_dt_parsed'].dt.to_period('M')
-        ).size().reset_index(name='count')
-        
-        monthly.columns = ['month', 'count']
-        monthly['month'] = monthly['month'].astype(str)
-        
-        # Calculate growth rates
-        monthly['growth_rate'] = monthly['count'].pct_change() * 100
-        
-        print(f"  📅 Analysis period: {monthly['month'].min()} to {monthly['month'].max()}")
-        print(f"  📊 Average monthly reports: {monthly['count'].mean():.0f}")
+        self._p("\n📈 Temporal Signal Analysis...")
+        
+        # fda_dt is a YYYYMMDD integer, so the month key is YYYYMM = fda_dt // 100;
+        # values without a plausible month/day are dropped like unparseable dates
+        fda_dt = pd.to_numeric(self.demo_df['fda_dt'], errors='coerce').to_numpy(dtype=np.float64)
+        with np.errstate(invalid='ignore'):
+            month, day = fda_dt // 100 % 100, fda_dt % 100
+            plausible = (month >= 1) & (month <= 12) & (day >= 1) & (day <= 31)
+        month_key = (fda_dt[plausible] // 100).astype(np.int64)
+        
+        # Monthly aggregation: sorted distinct YYYYMM keys and their counts
+        keys, counts = np.unique(month_key, return_counts=True)
+        
+        # Calculate growth rates between consecutive reporting months
+        growth_rate = np.empty(len(counts))
+        growth_rate[:1] = np.nan
+        growth_rate[1:] = np.diff(counts) / counts[:-1] * 100
+        
+        # Only format the keys for display, e.g. 202507 -> '2025-07'
+        monthly = pd.DataFrame({
+            'month': [f'{key // 100:04d}-{key % 100:02d}' for key in keys],
+            'count': counts,
+            'growth_rate': growth_rate
+        })
+        
+        self._p(f"  📅 Analysis period: {monthly['month'].min()} to {monthly['month'].max()}")
+        self._p(f"  📊 Average monthly reports: {monthly['count'].mean():.0f}")
         
         # Identify months with unusual growth
-        unusual_growth = monthly[abs(monthly['growth_rate']) > 50]
+        unusual_growth = monthly[np.abs(growth_rate) > 50]
         
         if len(unusual_growth) > 0:
-            print(f"\n  🚨 Months with unusual growth (>50% change):")
+            self._p(f"\n  🚨 Months with unusual growth (>50% change):")
             for idx, row in unusual_growth.iterrows():
                 direction = "📈" if row['growth_rate'] > 0 else "📉"
-                print(f"    {direction} {row['month']}: {row['growth_rate']:+.1f}% ({row['count']:,} reports)")
+                self._p(f"    {direction} {row['month']}: {row['growth_rate']:+.1f}% ({row['count']:,} reports)")
         
         return monthly
     
@@ -253,28 +423,22 @@ class SafetySignalDetector:
         Analyze adverse events by drug characteristics
         Useful for identifying class-wide safety issues
         """
-        print("\n💊 Drug Class Analysis...")
+        self._p("\n💊 Drug Class Analysis...")
         
         # Get most reported drugs
         top_drugs = self.drug_df[
             self.drug_df['role_cod'] == 'PS'
-        ]['drugname'].value_counts().head(20)
+        ]['drugname'].value_counts(sort=False).nlargest(20)
         
-        print(f"  🔝 Top 20 Most Reported Drugs:")
-        print()
+        self._p(f"  🔝 Top 20 Most Reported Drugs:")
+        self._p()
         for idx, (drug, count) in enumerate(top_drugs.items(), 1):
-            print(f"    {idx:2d}. {drug[:50]:50s} : {count:6,} reports")
+            self._p(f"    {idx:2d}. {drug[:50]:50s} : {count:6,} reports")
         
         # Get reactions associated with top drugs
-        print(f"\n  Analyzing reaction patterns for top drugs...")
+        self._p(f"\n  Analyzing reaction patterns for top drugs...")
         
-        drug_reactions = self.drug_df.merge(
-            self.reac_df,
-            on=['primaryid', 'caseid'],
-            how='inner'
-        )
-        
-        drug_reactions = drug_reactions[drug_reactions['role_cod'] == 'PS']
+        drug_reactions = self._get_drug_reac_ps()
         
         return top_drugs, drug_reactions
     
@@ -283,117 +447,156 @@ class SafetySignalDetector:
         ML-based prediction of serious outcome risk
         Demonstrates predictive analytics for case prioritization
         """
-        print("\n🤖 ML-Based Serious Outcome Risk Prediction...")
+        self._p("\n🤖 ML-Based Serious Outcome Risk Prediction...")
         
-        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.ensemble import HistGradientBoostingClassifier
+        from sklearn.inspection import permutation_importance
         from sklearn.model_selection import train_test_split
         from sklearn.metrics import classification_report, roc_auc_score
         
         # Merge data for feature engineering
-        cases_with_outcomes = self.demo_df.merge(
-            self.outc_df,
-            on=['primaryid', 'caseid'],
-            how='left'
-        )
+        cases_with_outcomes = self._get_demo_outc()
         
-        # Define serious outcome
-        serious_codes = ['DE', 'LT', 'HO', 'DS', 'CA', 'RI']
-        cases_with_outcomes['serious'] = cases_with_outcomes['outc_cod'].isin(serious_codes).astype(int)
+        # Serious outcome target, shared with the outcome analysis
+        serious = pd.Series(self._get_serious_mask().astype(int), index=cases_with_outcomes.index)
         
-        # Feature engineering
-        features = pd.DataFrame()
+        # Feature engineering: one contiguous float32 matrix, filled column by column
+        feature_names = [
+            'age', 'age_unknown', 'age_elderly', 'age_pediatric',
+            'sex_male', 'sex_female',
+            'reporter_md', 'reporter_pharm',
+            'expedited'
+        ]
+        X = np.zeros((len(cases_with_outcomes), len(feature_names)), dtype=np.float32)
         
         # Age-based features
-        features['age'] = cases_with_outcomes['age'].fillna(cases_with_outcomes['age'].median())
-        features['age_unknown'] = cases_with_outcomes['age'].isna().astype(int)
-        features['age_elderly'] = (features['age'] >= 65).astype(int)
-        features['age_pediatric'] = (features['age'] < 18).astype(int)
+        age = cases_with_outcomes['age'].to_numpy(dtype=np.float32)
+        age_unknown = np.isnan(age)
+        X[:, 0] = np.where(age_unknown, np.nanmedian(age), age)
+        X[:, 1] = age_unknown
+        X[:, 2] = X[:, 0] >= 65
+        X[:, 3] = X[:, 0] < 18
         
         # Sex
-        features['sex_male'] = (cases_with_outcomes['sex'] == 'M').astype(int)
-        features['sex_female'] = (cases_with_outcomes['sex'] == 'F').astype(int)
+        X[:, 4] = (cases_with_outcomes['sex'] == 'M').to_numpy()
+        X[:, 5] = (cases_with_outcomes['sex'] == 'F').to_numpy()
         
         # Reporter type
-        features['reporter_md'] = (cases_with_outcomes['occp_cod'] == 'MD').astype(int)
-        features['reporter_pharm'] = (cases_with_outcomes['occp_cod'] == 'PH').astype(int)
+        X[:, 6] = (cases_with_outcomes['occp_cod'] == 'MD').to_numpy()
+        X[:, 7] = (cases_with_outcomes['occp_cod'] == 'PH').to_numpy()
         
         # Report source
-        features['expedited'] = (cases_with_outcomes['rept_cod'] == 'EXP').astype(int)
+        X[:, 8] = (cases_with_outcomes['rept_cod'] == 'EXP').to_numpy()
         
         # Target
-        y = cases_with_outcomes['serious']
+        y = serious
         
         # Remove rows with missing target
-        valid_mask = y.notna()
-        features = features[valid_mask]
-        y = y[valid_mask]
+        valid_mask = y.notna().to_numpy()
+        if not valid_mask.all():
+            X = X[valid_mask]
+            y = y[valid_mask]
         
-        if len(features) > 100 and y.sum() > 10:
+        if len(X) > 100 and y.sum() > 10:
             # Train/test split
             X_train, X_test, y_train, y_test = train_test_split(
-                features, y, test_size=0.3, random_state=42, stratify=y
+                X, y, test_size=0.3, random_state=42, stratify=y
             )
             
-            # Train model
-            print("  🔧 Training Random Forest classifier...")
-            rf = RandomForestClassifier(
-                n_estimators=100,
-                max_depth=10,
-                random_state=42,
-                n_jobs=-1
+            # Train model (histogram-based trees; parallelised internally with OpenMP)
+            self._p("  🔧 Training Histogram Gradient Boosting classifier...")
+            model = HistGradientBoostingClassifier(
+                max_iter=100,
+                max_depth=8,
+                learning_rate=0.1,
+                random_state=42
             )
-            rf.fit(X_train, y_train)
+            model.fit(X_train, y_train)
             
             # Evaluate
-            y_pred = rf.predict(X_test)
-            y_proba = rf.predict_proba(X_test)[:, 1]
+            y_pred = model.predict(X_test)
+            y_proba = model.predict_proba(X_test)[:, 1]
             
             auc = roc_auc_score(y_test, y_proba)
             
-            print(f"\n  📊 Model Performance:")
-            print(f"    - ROC-AUC Score: {auc:.3f}")
-            print(f"    - Accuracy: {(y_pred == y_test).mean():.3f}")
+            self._p(f"\n  📊 Model Performance:")
+            self._p(f"    - ROC-AUC Score: {auc:.3f}")
+            self._p(f"    - Accuracy: {(y_pred == y_test).mean():.3f}")
             
-            # Feature importance
+            # Feature importance (boosted trees have no impurity importances; use
+            # the drop in held-out ROC-AUC when each feature is shuffled)
+            permuted = permutation_importance(
+                model, X_test, y_test, scoring='roc_auc', n_repeats=5, random_state=42
+            )
             importance = pd.DataFrame({
-                'feature': features.columns,
-                'importance': rf.feature_importances_
+                'feature': feature_names,
+                'importance': permuted.importances_mean
             }).sort_values('importance', ascending=False)
             
-            print(f"\n  🎯 Top Predictive Features:")
+            self._p(f"\n  🎯 Top Predictive Features:")
             for idx, row in importance.head(5).iterrows():
-                print(f"    {row['feature']:20s}: {row['importance']:.3f}")
+                self._p(f"    {row['feature']:20s}: {row['importance']:.3f}")
             
-            print("\n  💡 Use case: Automatically flag high-risk cases for priority review")
+            self._p("\n  💡 Use case: Automatically flag high-risk cases for priority review")
             
-            return rf, features, y
+            return model, pd.DataFrame(X, columns=feature_names, copy=False), y
         else:
-            print("  ⚠️  Insufficient data for ML model training in sample")
+            self._p("  ⚠️  Insufficient data for ML model training in sample")
             return None, None, None
     
     def generate_signal_report(self):
         """Generate comprehensive safety signal report"""
-        print("\n" + "="*70)
-        print("🚨 FDA FAERS SAFETY SIGNAL DETECTION REPORT - Q3 2025")
-        print("="*70)
-        
-        # Run all analyses
-        signals = self.calculate_prr()
-        outcomes = self.identify_serious_outcomes()
-        temporal = self.temporal_signal_analysis()
-        drug_analysis = self.drug_class_analysis()
-        ml_model = self.predict_serious_outcome_risk()
-        
-        print("\n" + "="*70)
-        print("✅ SIGNAL DETECTION COMPLETE")
-        print("="*70)
-        
-        print(f"\n📊 Summary:")
-        print(f"  - Safety signals detected: {len(signals) if len(signals) > 0 else 0}")
-        print(f"  - Cases with serious outcomes: {outcomes[1].get('Death', 0) + outcomes[1].get('Life-Threatening', 0):,}")
-        print(f"  - Deaths reported: {outcomes[1].get('Death', 0):,}")
-        print(f"  - Unique drugs analyzed: {len(self.drug_df['drugname'].unique()):,}")
-        print(f"  - Unique reactions: {len(self.reac_df['pt'].unique()):,}")
+        # Collect the report and write it to stdout in one go
+        self._out = io.StringIO()
+        try:
+            return self._run_report()
+        finally:
+            sys.stdout.write(self._out.getvalue())
+            self._out = None
+    
+    def _run_stage(self, stage, buffer):
+        """Run one report stage in a worker thread, printing into buffer"""
+        self._local.out = buffer
+        try:
+            return stage()
+        finally:
+            del self._local.out
+    
+    def _run_report(self):
+        """Run all analyses and the summary, printing through _p"""
+        self._p("\n" + "="*70)
+        self._p("🚨 FDA FAERS SAFETY SIGNAL DETECTION REPORT - Q3 2025")
+        self._p("="*70)
+        
+        # Run all analyses concurrently (pandas, NumPy and sklearn release the GIL
+        # in their kernels); each prints into its own buffer, written in stage order
+        stages = [
+            self.calculate_prr,
+            self.identify_serious_outcomes,
+            self.temporal_signal_analysis,
+            self.drug_class_analysis,
+            self.predict_serious_outcome_risk
+        ]
+        buffers = [io.StringIO() for _ in stages]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(self._run_stage, stage, buffer) for stage, buffer in zip(stages, buffers)]
+            wait(futures)
+        for buffer in buffers:
+            self._out.write(buffer.getvalue())
+        signals, outcomes, temporal, drug_analysis, ml_model = [f.result() for f in futures]
+        
+        self._p("\n" + "="*70)
+        self._p("✅ SIGNAL DETECTION COMPLETE")
+        self._p("="*70)
+        
+        self._p(f"\n📊 Summary:")
+        self._p(f"  - Safety signals detected: {len(signals) if len(signals) > 0 else 0}")
+        serious_counts = outcomes[1]
+        deaths = serious_counts.get('Death', 0)
+        self._p(f"  - Cases with serious outcomes: {deaths + serious_counts.get('Life-Threatening', 0):,}")
+        self._p(f"  - Deaths reported: {deaths:,}")
+        self._p(f"  - Unique drugs analyzed: {_count_distinct(self.drug_df['drugname']):,}")
+        self._p(f"  - Unique reactions: {_count_distinct(self.reac_df['pt']):,}")
         
         return {
             'signals': signals,
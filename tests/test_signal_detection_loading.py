@@ -0,0 +1,83 @@
+"""
+Loading tests for SafetySignalDetector on a tiny synthetic FAERS extract
+Run with: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import demo_signal_detection as sd
+
+FILES = {
+    'DEMO25Q3.txt': [
+        'primaryid$caseid$fda_dt$age$sex$occp_cod$rept_cod',
+        '101$1$20250701$45$F$MD$EXP',
+        '102$$20250702$$M$CN$PER',
+        '103$3$20250703$70$F$PH$EXP',
+    ],
+    'DRUG25Q3.txt': [
+        'primaryid$caseid$drug_seq$role_cod$drugname',
+        '101$1$1$PS$DRUGA',
+        '102$$1$PS$DRUGB',
+        '103$3$1$SS$DRUGA',
+    ],
+    'REAC25Q3.txt': [
+        'primaryid$caseid$pt',
+        '101$1$Nausea',
+        '102$$Headache',
+        '103$3$Nausea',
+    ],
+    'OUTC25Q3.txt': [
+        'primaryid$caseid$outc_cod',
+        '101$1$HO',
+        '102$$DE',
+    ],
+}
+
+
+class BlankCaseidTest(unittest.TestCase):
+    """A report with an empty caseid loads on both engines"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.tmp.name)
+        (self.data_path / 'ASCII').mkdir()
+        for name, lines in FILES.items():
+            (self.data_path / 'ASCII' / name).write_text('\n'.join(lines) + '\n', encoding='latin1')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def check_loaded(self, detector):
+        self.assertEqual(len(detector.demo_df), 3)
+        self.assertEqual(len(detector.drug_df), 3)
+        self.assertEqual(len(detector.reac_df), 3)
+        self.assertEqual(len(detector.outc_df), 2)
+        demo = detector.demo_df.set_index('primaryid')
+        self.assertTrue(demo.loc[102, 'caseid'] != demo.loc[102, 'caseid'])  # NaN
+        self.assertEqual(demo.loc[103, 'caseid'], 3)
+
+    def test_pandas_engine(self):
+        with mock.patch.object(sd, 'pa', None):
+            detector = sd.SafetySignalDetector(self.data_path)
+            detector.load_data(sample_size=10)
+        self.check_loaded(detector)
+
+    @unittest.skipIf(sd.pa is None, 'pyarrow not installed')
+    def test_arrow_engine(self):
+        detector = sd.SafetySignalDetector(self.data_path)
+        detector.load_data(sample_size=10)
+        self.check_loaded(detector)
+
+        # Second load is served from the Parquet cache
+        detector.load_data(sample_size=10)
+        self.check_loaded(detector)
+
+
+if __name__ == '__main__':
+    unittest.main()